@@ -35,20 +35,26 @@ from __future__ import unicode_literals
 
 import argparse
 import logging
+import threading
 from datetime import datetime
 from datetime import timedelta
 
 import pysensu_yelp
+from concurrent.futures import ThreadPoolExecutor
 
 from paasta_tools import marathon_tools
+from paasta_tools import mesos_tools
 from paasta_tools import monitoring_tools
 from paasta_tools.marathon_tools import format_job_id
-from paasta_tools.smartstack_tools import load_smartstack_info_for_service
+from paasta_tools.smartstack_tools import get_smartstack_replication_for_attribute
 from paasta_tools.utils import _log
 from paasta_tools.utils import compose_job_id
+from paasta_tools.utils import configure_log
 from paasta_tools.utils import datetime_from_utc_to_local
+from paasta_tools.utils import decompose_job_id
 from paasta_tools.utils import DEFAULT_SOA_DIR
 from paasta_tools.utils import get_services_for_cluster
+from paasta_tools.utils import InvalidJobNameError
 from paasta_tools.utils import is_under_replicated
 from paasta_tools.utils import load_system_paasta_config
 from paasta_tools.utils import NoDeploymentsAvailable
@@ -56,38 +62,54 @@ from paasta_tools.utils import NoDeploymentsAvailable
 
 log = logging.getLogger(__name__)
 
+# Number of service instances checked concurrently; each check is dominated
+# by network round trips to marathon, mesos, synapse and sensu
+MAX_CHECK_WORKERS = 16
 
-def send_event(service, namespace, cluster, soa_dir, status, output):
+# The scribe log writer echoes every line to stderr; serialize the writes so
+# multi-line alert bodies from concurrent checks do not interleave
+_log_lock = threading.Lock()
+
+
+def send_event(service, namespace, cluster, soa_dir, status, output, job_config, system_paasta_config,
+               monitoring_config):
     """Send an event to sensu via pysensu_yelp with the given information.
 
     :param service: The service name the event is about
     :param namespace: The namespace of the service the event is about
     :param soa_dir: The service directory to read monitoring information from
     :param status: The status to emit for this event
-    :param output: The output to emit for this event"""
+    :param output: The output to emit for this event
+    :param job_config: The MarathonServiceConfig of the instance the event is about
+    :param system_paasta_config: A SystemPaastaConfig object representing the system configuration.
+    :param monitoring_config: The service's monitoring settings, from monitoring_tools.get_monitoring_config"""
     # This function assumes the input is a string like "mumble.main"
-    monitoring_overrides = marathon_tools.load_marathon_service_config(
-        service=service,
-        instance=namespace,
-        cluster=cluster,
-        soa_dir=soa_dir,
-        load_deployments=False,
-    ).get_monitoring()
+    monitoring_overrides = dict(job_config.get_monitoring())
     if 'alert_after' not in monitoring_overrides:
         monitoring_overrides['alert_after'] = '2m'
     monitoring_overrides['check_every'] = '1m'
-    monitoring_overrides['runbook'] = monitoring_tools.get_runbook(monitoring_overrides, service, soa_dir=soa_dir)
+    monitoring_overrides.setdefault('runbook', monitoring_config['runbook'])
 
     check_name = 'check_marathon_services_replication.%s' % compose_job_id(service, namespace)
-    monitoring_tools.send_event(service, check_name, monitoring_overrides, status, output, soa_dir)
-    _log(
+    monitoring_tools.send_event(
         service=service,
-        line='Replication: %s' % output,
-        component='monitoring',
-        level='debug',
-        cluster=cluster,
-        instance=namespace,
+        check_name=check_name,
+        overrides=monitoring_overrides,
+        status=status,
+        output=output,
+        soa_dir=soa_dir,
+        system_paasta_config=system_paasta_config,
+        monitoring_config=monitoring_config,
     )
+    with _log_lock:
+        _log(
+            service=service,
+            line='Replication: %s' % output,
+            component='monitoring',
+            level='debug',
+            cluster=cluster,
+            instance=namespace,
+        )
 
 
 def parse_args():
@@ -111,6 +133,10 @@ def check_smartstack_replication_for_instance(
     soa_dir,
     expected_count,
     system_paasta_config,
+    job_config,
+    service_namespace_config,
+    monitoring_config,
+    slaves,
 ):
     """Check a set of namespaces to see if their number of available backends is too low,
     emitting events to Sensu based on the fraction available and the thresholds defined in
@@ -121,54 +147,45 @@ def check_smartstack_replication_for_instance(
     :param cluster: name of the cluster
     :param soa_dir: The SOA configuration directory to read from
     :param system_paasta_config: A SystemPaastaConfig object representing the system configuration.
+    :param job_config: The MarathonServiceConfig of the instance being checked
+    :param service_namespace_config: The ServiceNamespaceConfig of the instance's smartstack namespace
+    :param monitoring_config: The service's monitoring settings, from monitoring_tools.get_monitoring_config
+    :param slaves: The list of mesos slaves, fetched once per run by main()
     """
     full_name = compose_job_id(service, instance)
-
-    primary_registration = marathon_tools.read_registration_for_service_instance(
-        service, instance, soa_dir=soa_dir
-    )
-
-    if primary_registration != full_name:
-        log.debug(
-            '%s is announced under: %s. '
-            'Not checking replication for it' % (full_name, primary_registration)
-        )
-        return
-
-    job_config = marathon_tools.load_marathon_service_config(service, instance, cluster)
     crit_threshold = job_config.get_replication_crit_percentage()
     monitoring_blacklist = job_config.get_monitoring_blacklist()
     log.info('Checking instance %s in smartstack', full_name)
-    smartstack_replication_info = load_smartstack_info_for_service(
+    smartstack_replication_info = get_smartstack_replication_for_attribute(
+        attribute=service_namespace_config.get_discover(),
         service=service,
         namespace=instance,
-        soa_dir=soa_dir,
         blacklist=monitoring_blacklist,
         system_paasta_config=system_paasta_config,
+        slaves=slaves,
     )
-    log.debug('Got smartstack replication info for %s: %s' % (full_name, smartstack_replication_info))
+    log.debug('Got smartstack replication info for %s: %s', full_name, smartstack_replication_info)
 
-    if len(smartstack_replication_info) == 0:
+    num_locations = len(smartstack_replication_info)
+    if num_locations == 0:
         status = pysensu_yelp.Status.CRITICAL
         output = ('Service %s has no Smartstack replication info. Make sure the discover key in your smartstack.yaml '
                   'is valid!\n') % full_name
         log.error(output)
     else:
-        expected_count_per_location = int(expected_count / len(smartstack_replication_info))
-        output = ''
+        expected_count_per_location = expected_count // num_locations
+        output_lines = []
         under_replication_per_location = []
 
-        for location, available_backends in sorted(smartstack_replication_info.iteritems()):
-            num_available_in_location = available_backends.get(full_name, 0)
+        for location in sorted(smartstack_replication_info):
+            num_available_in_location = smartstack_replication_info[location].get(full_name, 0)
             under_replicated, ratio = is_under_replicated(
                 num_available_in_location, expected_count_per_location, crit_threshold)
-            if under_replicated:
-                output += '- Service %s has %d out of %d expected instances in %s (CRITICAL: %d%%)\n' % (
-                    full_name, num_available_in_location, expected_count_per_location, location, ratio)
-            else:
-                output += '- Service %s has %d out of %d expected instances in %s (OK: %d%%)\n' % (
-                    full_name, num_available_in_location, expected_count_per_location, location, ratio)
+            output_lines.append('- Service %s has %d out of %d expected instances in %s (%s: %d%%)\n' % (
+                full_name, num_available_in_location, expected_count_per_location, location,
+                'CRITICAL' if under_replicated else 'OK', ratio))
             under_replication_per_location.append(under_replicated)
+        output = ''.join(output_lines)
 
         if any(under_replication_per_location):
             status = pysensu_yelp.Status.CRITICAL
@@ -208,12 +225,21 @@ def check_smartstack_replication_for_instance(
         else:
             status = pysensu_yelp.Status.OK
             log.info(output)
-    send_event(service=service, namespace=instance, cluster=cluster, soa_dir=soa_dir, status=status, output=output)
+    send_event(
+        service=service,
+        namespace=instance,
+        cluster=cluster,
+        soa_dir=soa_dir,
+        status=status,
+        output=output,
+        job_config=job_config,
+        system_paasta_config=system_paasta_config,
+        monitoring_config=monitoring_config,
+    )
 
 
-def get_healthy_marathon_instances_for_short_app_id(client, app_id):
-    tasks = client.list_tasks()
-    tasks_for_app = [task for task in tasks if task.app_id.startswith('/%s' % app_id)]
+def get_healthy_marathon_instances_for_short_app_id(all_tasks, app_id):
+    tasks_for_app = [task for task in all_tasks if task.app_id.startswith('/%s' % app_id)]
 
     one_minute_ago = datetime.now() - timedelta(minutes=1)
 
@@ -226,11 +252,12 @@ def get_healthy_marathon_instances_for_short_app_id(client, app_id):
     return len(healthy_tasks)
 
 
-def check_healthy_marathon_tasks_for_service_instance(client, service, instance, cluster,
-                                                      soa_dir, expected_count):
+def check_healthy_marathon_tasks_for_service_instance(all_tasks, service, instance, cluster,
+                                                      soa_dir, expected_count, job_config,
+                                                      system_paasta_config, monitoring_config):
     app_id = format_job_id(service, instance)
-    log.info("Checking %s in marathon as it is not in smartstack" % app_id)
-    num_healthy_tasks = get_healthy_marathon_instances_for_short_app_id(client, app_id)
+    log.info("Checking %s in marathon as it is not in smartstack", app_id)
+    num_healthy_tasks = get_healthy_marathon_instances_for_short_app_id(all_tasks, app_id)
     send_event_if_under_replication(
         service=service,
         instance=instance,
@@ -238,6 +265,9 @@ def check_healthy_marathon_tasks_for_service_instance(client, service, instance,
         expected_count=expected_count,
         num_available=num_healthy_tasks,
         soa_dir=soa_dir,
+        job_config=job_config,
+        system_paasta_config=system_paasta_config,
+        monitoring_config=monitoring_config,
     )
 
 
@@ -248,9 +278,11 @@ def send_event_if_under_replication(
     expected_count,
     num_available,
     soa_dir,
+    job_config,
+    system_paasta_config,
+    monitoring_config,
 ):
     full_name = compose_job_id(service, instance)
-    job_config = marathon_tools.load_marathon_service_config(service, instance, cluster)
     crit_threshold = job_config.get_replication_crit_percentage()
     output = ('Service %s has %d out of %d expected instances available!\n' +
               '(threshold: %d%%)') % (full_name, num_available, expected_count, crit_threshold)
@@ -290,29 +322,62 @@ def send_event_if_under_replication(
         cluster=cluster,
         soa_dir=soa_dir,
         status=status,
-        output=output)
+        output=output,
+        job_config=job_config,
+        system_paasta_config=system_paasta_config,
+        monitoring_config=monitoring_config,
+    )
 
 
-def check_service_replication(client, service, instance, cluster, soa_dir, system_paasta_config):
+def check_service_replication(
+    all_tasks,
+    slaves,
+    service,
+    instance,
+    cluster,
+    soa_dir,
+    system_paasta_config,
+    job_config,
+    service_namespace_config,
+    monitoring_config,
+):
     """Checks a service's replication levels based on how the service's replication
     should be monitored. (smartstack or mesos)
 
+    :param all_tasks: Every task known to marathon, as returned by MarathonClient.list_tasks()
+    :param slaves: Every mesos slave, as returned by mesos_tools.get_slaves()
     :param service: Service name, like "example_service"
     :param instance: Instance name, like "main" or "canary"
     :param cluster: name of the cluster
     :param soa_dir: The SOA configuration directory to read from
     :param system_paasta_config: A SystemPaastaConfig object representing the system configuration.
+    :param job_config: The MarathonServiceConfig of the instance, loaded once by main()
+    :param service_namespace_config: The ServiceNamespaceConfig of the instance's primary registration
+    :param monitoring_config: The service's monitoring settings, loaded once per service by main()
     """
     job_id = compose_job_id(service, instance)
+    # Same lookup as marathon_tools.get_proxy_port_for_instance, but served from
+    # the configs main() already loaded instead of re-reading them
+    proxy_port = service_namespace_config.get('proxy_port')
+    if proxy_port is not None:
+        # Done before counting expected instances so skipped instances cost nothing more
+        primary_registration = job_config.get_registrations()[0]
+        if primary_registration != job_id:
+            log.debug(
+                '%s is announced under: %s. '
+                'Not checking replication for it', job_id, primary_registration
+            )
+            return
     try:
-        expected_count = marathon_tools.get_expected_instance_count_for_namespace(service, instance, soa_dir=soa_dir)
+        # Passing the cluster stops every call from reloading the system paasta config
+        expected_count = marathon_tools.get_expected_instance_count_for_namespace(
+            service, instance, cluster=cluster, soa_dir=soa_dir)
     except NoDeploymentsAvailable:
-        log.debug('deployments.json missing for %s. Skipping replication monitoring.' % job_id)
+        log.debug('deployments.json missing for %s. Skipping replication monitoring.', job_id)
         return
     if expected_count is None:
         return
-    log.info("Expecting %d total tasks for %s" % (expected_count, job_id))
-    proxy_port = marathon_tools.get_proxy_port_for_instance(service, instance, soa_dir=soa_dir)
+    log.info("Expecting %d total tasks for %s", expected_count, job_id)
     if proxy_port is not None:
         check_smartstack_replication_for_instance(
             service=service,
@@ -321,15 +386,22 @@ def check_service_replication(client, service, instance, cluster, soa_dir, syste
             soa_dir=soa_dir,
             expected_count=expected_count,
             system_paasta_config=system_paasta_config,
+            job_config=job_config,
+            service_namespace_config=service_namespace_config,
+            monitoring_config=monitoring_config,
+            slaves=slaves,
         )
     else:
         check_healthy_marathon_tasks_for_service_instance(
-            client=client,
+            all_tasks=all_tasks,
             service=service,
             instance=instance,
             cluster=cluster,
             soa_dir=soa_dir,
             expected_count=expected_count,
+            job_config=job_config,
+            system_paasta_config=system_paasta_config,
+            monitoring_config=monitoring_config,
         )
 
 
@@ -347,19 +419,74 @@ def main():
     cluster = system_paasta_config.get_cluster()
     service_instances = get_services_for_cluster(
         cluster=cluster, instance_type='marathon', soa_dir=args.soa_dir)
-
-    config = marathon_tools.load_marathon_config()
-    client = marathon_tools.get_marathon_client(config.get_url(), config.get_username(), config.get_password())
-    for service, instance in service_instances:
-
-        check_service_replication(
-            client=client,
+    # Load each instance config once up front: without this, every check and
+    # every event for an instance re-reads and re-parses the same yelpsoa files.
+    job_configs = {
+        (service, instance): marathon_tools.load_marathon_service_config(
             service=service,
             instance=instance,
             cluster=cluster,
             soa_dir=soa_dir,
-            system_paasta_config=system_paasta_config,
+            load_deployments=False,
         )
+        for service, instance in service_instances
+    }
+    # Map each instance to the smartstack config of its primary registration up
+    # front. Several instances can share a registration, so each one is read once.
+    namespace_configs_by_registration = {}
+    service_namespace_configs = {}
+    for service_instance, job_config in job_configs.items():
+        registration = job_config.get_registrations()[0]
+        if registration not in namespace_configs_by_registration:
+            try:
+                registration_service, registration_namespace, _, __ = decompose_job_id(registration)
+            except InvalidJobNameError:
+                # Only skip this instance; one bad registration must not stop the whole run
+                log.error('%s has an invalid registration %s. Skipping replication monitoring.',
+                          compose_job_id(*service_instance), registration)
+                continue
+            namespace_configs_by_registration[registration] = marathon_tools.load_service_namespace_config(
+                service=registration_service,
+                namespace=registration_namespace,
+                soa_dir=soa_dir,
+            )
+        service_namespace_configs[service_instance] = namespace_configs_by_registration[registration]
+    # Monitoring settings only vary by service, so read them once per service
+    monitoring_configs = {
+        service: monitoring_tools.get_monitoring_config(service, soa_dir=soa_dir)
+        for service in {service for service, _ in service_instances}
+    }
+
+    config = marathon_tools.load_marathon_config()
+    client = marathon_tools.get_marathon_client(config.get_url(), config.get_username(), config.get_password())
+    # One listing for the whole run instead of one per non-smartstack instance
+    all_tasks = client.list_tasks()
+    # Likewise, every smartstack check needs the slave list to pick synapse hosts
+    slaves = mesos_tools.get_slaves()
+    # _log() would otherwise configure the log writer lazily, racing on the
+    # first events sent from the check threads
+    configure_log()
+    with ThreadPoolExecutor(max_workers=MAX_CHECK_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                check_service_replication,
+                all_tasks=all_tasks,
+                slaves=slaves,
+                service=service,
+                instance=instance,
+                cluster=cluster,
+                soa_dir=soa_dir,
+                system_paasta_config=system_paasta_config,
+                job_config=job_configs[(service, instance)],
+                service_namespace_config=service_namespace_configs[(service, instance)],
+                monitoring_config=monitoring_configs[service],
+            )
+            for service, instance in service_instances
+            if (service, instance) in service_namespace_configs
+        ]
+        # Re-raise any exception from a check, as the serial loop used to
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
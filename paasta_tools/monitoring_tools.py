@@ -27,7 +27,6 @@ import json
 import logging
 import os
 
-import pysensu_yelp
 import service_configuration_lib
 
 from paasta_tools.utils import DEFAULT_SOA_DIR
@@ -36,6 +35,21 @@ from paasta_tools.utils import load_system_paasta_config
 
 log = logging.getLogger(__name__)
 
+MONITORING_KEYS = (
+    'team',
+    'runbook',
+    'tip',
+    'notification_email',
+    'page',
+    'alert_after',
+    'realert_every',
+    'check_every',
+    'irc_channels',
+    'dependencies',
+    'ticket',
+    'project',
+)
+
 
 def get_team(overrides, service, soa_dir=DEFAULT_SOA_DIR):
     return __get_monitoring_config_value('team', overrides, service, soa_dir)
@@ -88,10 +102,27 @@ def get_project(overrides, service, soa_dir=DEFAULT_SOA_DIR):
 def __get_monitoring_config_value(key, overrides, service, soa_dir=DEFAULT_SOA_DIR):
     general_config = service_configuration_lib.read_service_configuration(service, soa_dir=soa_dir)
     monitor_config = read_monitoring_config(service, soa_dir=soa_dir)
+    service_default = __get_service_default(key, general_config, monitor_config)
+    return overrides.get(key, service_default)
+
+
+def __get_service_default(key, general_config, monitor_config):
     service_default = general_config.get(key, monitoring_defaults(key))
     service_default = general_config.get('monitoring', {key: service_default}).get(key, service_default)
-    service_default = monitor_config.get(key, service_default)
-    return overrides.get(key, service_default)
+    return monitor_config.get(key, service_default)
+
+
+def get_monitoring_config(service, soa_dir=DEFAULT_SOA_DIR):
+    """Resolve the service-wide value of every monitoring key with a single read
+    of service.yaml and monitoring.yaml, rather than one read per key.
+
+    :param service: The service name
+    :param soa_dir: The SOA configuration directory to read from
+    :returns: A dictionary mapping each of MONITORING_KEYS to its value, before
+              any per-instance overrides are applied"""
+    general_config = service_configuration_lib.read_service_configuration(service, soa_dir=soa_dir)
+    monitor_config = read_monitoring_config(service, soa_dir=soa_dir)
+    return {key: __get_service_default(key, general_config, monitor_config) for key in MONITORING_KEYS}
 
 
 def monitoring_defaults(key):
@@ -151,7 +182,17 @@ def _load_sensu_team_data():
     return team_data
 
 
-def send_event(service, check_name, overrides, status, output, soa_dir, ttl=None):
+def send_event(
+    service,
+    check_name,
+    overrides,
+    status,
+    output,
+    soa_dir,
+    ttl=None,
+    system_paasta_config=None,
+    monitoring_config=None,
+):
     """Send an event to sensu via pysensu_yelp with the given information.
 
     :param service: The service name the event is about
@@ -161,20 +202,30 @@ def send_event(service, check_name, overrides, status, output, soa_dir, ttl=None
     :param status: The status to emit for this event
     :param output: The output to emit for this event
     :param soa_dir: The service directory to read monitoring information from
+    :param system_paasta_config: A SystemPaastaConfig object representing the system configuration.
+                                 Loaded from disk if not provided.
+    :param monitoring_config: The service's monitoring settings as returned by get_monitoring_config,
+                              for callers sending many events for the same service. Read from disk
+                              if not provided.
     """
     # This function assumes the input is a string like "mumble.main"
-    team = get_team(overrides, service, soa_dir)
+    if monitoring_config is None:
+        monitoring_config = get_monitoring_config(service, soa_dir)
+    monitoring_config = dict(monitoring_config)
+    monitoring_config.update(overrides)
+    team = monitoring_config['team']
     if not team:
         return
     runbook = overrides.get('runbook', 'http://y/paasta-troubleshooting')
-    system_paasta_config = load_system_paasta_config()
+    if system_paasta_config is None:
+        system_paasta_config = load_system_paasta_config()
     result_dict = {
-        'tip': get_tip(overrides, service, soa_dir),
-        'notification_email': get_notification_email(overrides, service, soa_dir),
-        'irc_channels': get_irc_channels(overrides, service, soa_dir),
-        'ticket': get_ticket(overrides, service, soa_dir),
-        'project': get_project(overrides, service, soa_dir),
-        'page': get_page(overrides, service, soa_dir),
+        'tip': monitoring_config['tip'],
+        'notification_email': monitoring_config['notification_email'],
+        'irc_channels': monitoring_config['irc_channels'],
+        'ticket': monitoring_config['ticket'],
+        'project': monitoring_config['project'],
+        'page': monitoring_config['page'],
         'alert_after': overrides.get('alert_after', '5m'),
         'check_every': overrides.get('check_every', '1m'),
         'realert_every': overrides.get('realert_every', monitoring_defaults('realert_every')),
@@ -186,6 +237,9 @@ def send_event(service, check_name, overrides, status, output, soa_dir, ttl=None
     sensu_port = system_paasta_config.get_sensu_port()
 
     if sensu_host is not None:
+        # Imported here rather than at module level: this module is pulled in by
+        # the paasta CLI on every invocation, but only this path talks to sensu
+        import pysensu_yelp
         pysensu_yelp.send_event(check_name, runbook, status, output, team, sensu_host=sensu_host, sensu_port=sensu_port,
                                 **result_dict)
 
@@ -17,8 +17,10 @@ from __future__ import unicode_literals
 import collections
 import csv
 import socket
+import threading
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 from paasta_tools import marathon_tools
 from paasta_tools import mesos_tools
@@ -27,6 +29,53 @@ from paasta_tools.utils import DEFAULT_SOA_DIR
 from paasta_tools.utils import get_user_agent
 
 
+# Upper bound on concurrent synapse queries when checking replication across locations
+MAX_SYNAPSE_QUERY_WORKERS = 16
+# Number of synapse hosts whose keep-alive connections are kept open at once.
+# The replication check queries one host per location across every discover
+# attribute, so this must exceed requests' default of 10 or pools get evicted.
+MAX_SYNAPSE_HOST_POOLS = 32
+
+_synapse_query_executor = None
+_synapse_query_executor_lock = threading.Lock()
+
+_haproxy_adapter = None
+_haproxy_adapter_lock = threading.Lock()
+
+
+def get_synapse_query_executor():
+    """Returns the ThreadPoolExecutor that runs synapse queries, creating it on first use.
+
+    It is shared by every caller so concurrent replication checks draw from one
+    bounded set of threads. Only leaf synapse queries run on it, so waiting on
+    it from another pool's worker cannot deadlock.
+    """
+    global _synapse_query_executor
+    with _synapse_query_executor_lock:
+        if _synapse_query_executor is None:
+            _synapse_query_executor = ThreadPoolExecutor(max_workers=MAX_SYNAPSE_QUERY_WORKERS)
+        return _synapse_query_executor
+
+
+def get_haproxy_adapter():
+    """Returns the HTTPAdapter used to query synapse haproxy, creating it on first use.
+
+    Sharing one adapter lets repeated queries to the same synapse host reuse
+    its pooled keep-alive connection instead of reconnecting every time. Only
+    the adapter is shared: its urllib3 PoolManager is safe to use from several
+    threads, which requests does not promise for a Session.
+    """
+    global _haproxy_adapter
+    with _haproxy_adapter_lock:
+        if _haproxy_adapter is None:
+            _haproxy_adapter = requests.adapters.HTTPAdapter(
+                max_retries=3,
+                pool_connections=MAX_SYNAPSE_HOST_POOLS,
+                pool_maxsize=MAX_SYNAPSE_QUERY_WORKERS,
+            )
+        return _haproxy_adapter
+
+
 def retrieve_haproxy_csv(synapse_host, synapse_port, synapse_haproxy_url_format):
     """Retrieves the haproxy csv from the haproxy web interface
 
@@ -39,12 +88,8 @@ def retrieve_haproxy_csv(synapse_host, synapse_port, synapse_haproxy_url_format)
     # timeout after 1 second and retry 3 times
     haproxy_request = requests.Session()
     haproxy_request.headers.update({'User-Agent': get_user_agent()})
-    haproxy_request.mount(
-        'http://',
-        requests.adapters.HTTPAdapter(max_retries=3))
-    haproxy_request.mount(
-        'https://',
-        requests.adapters.HTTPAdapter(max_retries=3))
+    haproxy_request.mount('http://', get_haproxy_adapter())
+    haproxy_request.mount('https://', get_haproxy_adapter())
     haproxy_response = haproxy_request.get(synapse_uri, timeout=1)
     haproxy_data = haproxy_response.text
     reader = csv.DictReader(haproxy_data.splitlines())
@@ -135,7 +180,8 @@ def load_smartstack_info_for_service(service, namespace, blacklist, system_paast
     )
 
 
-def get_smartstack_replication_for_attribute(attribute, service, namespace, blacklist, system_paasta_config):
+def get_smartstack_replication_for_attribute(attribute, service, namespace, blacklist, system_paasta_config,
+                                             slaves=None):
     """Loads smartstack replication from a host with the specified attribute
 
     :param attribute: a Mesos attribute
@@ -144,14 +190,21 @@ def get_smartstack_replication_for_attribute(attribute, service, namespace, blac
     :param constraints: A list of Marathon constraints to restrict which synapse hosts to query
     :param blacklist: A list of blacklisted location tuples in the form of (location, value)
     :param system_paasta_config: A SystemPaastaConfig object representing the system configuration.
+    :param slaves: An already fetched list of mesos slaves, or None to fetch it from the mesos master
     :returns: a dictionary of the form {'<unique_attribute_value>': <smartstack replication hash>}
               (the dictionary will contain keys for unique all attribute values)
     """
-    replication_info = {}
-    filtered_slaves = mesos_tools.get_all_slaves_for_blacklist_whitelist(
-        blacklist=blacklist,
-        whitelist=[],
-    )
+    if slaves is None:
+        filtered_slaves = mesos_tools.get_all_slaves_for_blacklist_whitelist(
+            blacklist=blacklist,
+            whitelist=[],
+        )
+    else:
+        filtered_slaves = mesos_tools.filter_mesos_slaves_by_blacklist(
+            slaves=slaves,
+            blacklist=blacklist,
+            whitelist=[],
+        )
     if not filtered_slaves:
         raise mesos_tools.NoSlavesAvailableError
 
@@ -162,16 +215,21 @@ def get_smartstack_replication_for_attribute(attribute, service, namespace, blac
 
     full_name = compose_job_id(service, namespace)
 
-    for value, hosts in attribute_slave_dict.iteritems():
+    # Each location means a blocking HTTP request to a different synapse host,
+    # so issue them concurrently rather than paying for them one after another
+    executor = get_synapse_query_executor()
+    futures = {}
+    for value, hosts in attribute_slave_dict.items():
         # arbitrarily choose the first host with a given attribute to query for replication stats
         synapse_host = hosts[0]['hostname']
-        repl_info = get_replication_for_services(
+        futures[value] = executor.submit(
+            get_replication_for_services,
             synapse_host=synapse_host,
             synapse_port=system_paasta_config.get_synapse_port(),
             synapse_haproxy_url_format=system_paasta_config.get_synapse_haproxy_url_format(),
             services=[full_name],
         )
-        replication_info[value] = repl_info
+    replication_info = {value: future.result() for value, future in futures.items()}
 
     return replication_info
 
@@ -226,9 +284,10 @@ def ip_port_hostname_from_svname(svname):
     # split into parts
     parts = set(svname.split("_"))
 
-    # find those that can be split by : - this is the ip:port
-    # there will only be 1 of these
-    ip_ports = {part for part in parts if len(part.split(":")) == 2}
+    # find those that contain a single : - this is the ip:port
+    # there will only be 1 of these. Counting avoids splitting every part
+    # here only to split the ip:port again below.
+    ip_ports = {part for part in parts if part.count(":") == 1}
 
     # the one *not* in the list is the hostname
     hostname = parts.difference(ip_ports).pop()
@@ -1512,13 +1512,14 @@ def is_under_replicated(num_available, expected_count, crit_threshold):
     """
     if expected_count == 0:
         ratio = 100
+        under_replicated = ratio < int(crit_threshold)
     else:
         ratio = (num_available / float(expected_count)) * 100
+        # Decide in integers; the float ratio is only for display, since e.g.
+        # 29/100 comes out as 28.999...% and would fall under a 29% threshold
+        under_replicated = num_available * 100 < int(crit_threshold) * expected_count
 
-    if ratio < int(crit_threshold):
-        return (True, ratio)
-    else:
-        return (False, ratio)
+    return (under_replicated, ratio)
 
 
 def deploy_blacklist_to_constraints(deploy_blacklist):
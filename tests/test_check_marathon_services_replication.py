@@ -22,6 +22,7 @@ import mock
 import pysensu_yelp
 
 from paasta_tools import check_marathon_services_replication
+from paasta_tools.long_running_service_tools import ServiceNamespaceConfig
 from paasta_tools.marathon_tools import MarathonServiceConfig
 from paasta_tools.utils import compose_job_id
 from paasta_tools.utils import SystemPaastaConfig
@@ -38,39 +39,45 @@ def test_send_event_users_monitoring_tools_send_event_properly():
     fake_monitoring_overrides = {'fake_key': 'fake_value'}
     fake_soa_dir = '/hi/hello/hey'
     fake_cluster = 'fake_cluster'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     expected_check_name = 'check_marathon_services_replication.%s' % compose_job_id(fake_service_name, fake_namespace)
     with contextlib.nested(
         mock.patch("paasta_tools.monitoring_tools.send_event", autospec=True),
         mock.patch('paasta_tools.check_marathon_services_replication.load_system_paasta_config', autospec=True),
         mock.patch("paasta_tools.check_marathon_services_replication._log", autospec=True),
-        mock.patch("paasta_tools.marathon_tools.load_marathon_service_config", autospec=True),
     ) as (
         send_event_patch,
         load_system_paasta_config_patch,
         log_patch,
-        load_marathon_service_config_patch,
     ):
-        load_marathon_service_config_patch.return_value.get_monitoring.return_value = fake_monitoring_overrides
+        mock_job_config = mock.Mock()
+        mock_job_config.get_monitoring.return_value = fake_monitoring_overrides
         check_marathon_services_replication.send_event(fake_service_name,
                                                        fake_namespace,
                                                        fake_cluster,
                                                        fake_soa_dir,
                                                        fake_status,
-                                                       fake_output)
+                                                       fake_output,
+                                                       mock_job_config,
+                                                       fake_system_paasta_config,
+                                                       fake_monitoring_config)
         send_event_patch.assert_called_once_with(
-            fake_service_name,
-            expected_check_name,
-            mock.ANY,
-            fake_status,
-            fake_output,
-            fake_soa_dir
+            service=fake_service_name,
+            check_name=expected_check_name,
+            overrides=mock.ANY,
+            status=fake_status,
+            output=fake_output,
+            soa_dir=fake_soa_dir,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         # The overrides dictionary is mutated in the function under test, so
         # we expect the send_event_patch to be called with something that is a
         # superset of what we originally put in (fake_monitoring_overrides)
-        actual_overrides_used = send_event_patch.call_args[0][2]
+        actual_overrides_used = send_event_patch.call_args[1]['overrides']
         assert set({'alert_after': '2m'}.items()).issubset(set(actual_overrides_used.items()))
-        assert 'runbook' in actual_overrides_used
+        assert actual_overrides_used['runbook'] == 'y/fake_runbook'
 
 
 def test_send_event_users_monitoring_tools_send_event_respects_alert_after():
@@ -82,38 +89,44 @@ def test_send_event_users_monitoring_tools_send_event_respects_alert_after():
     fake_monitoring_overrides = {'alert_after': '666m'}
     fake_soa_dir = '/hi/hello/hey'
     fake_cluster = 'fake_cluster'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     expected_check_name = 'check_marathon_services_replication.%s' % compose_job_id(fake_service_name, fake_namespace)
     with contextlib.nested(
         mock.patch("paasta_tools.monitoring_tools.send_event", autospec=True),
         mock.patch('paasta_tools.check_marathon_services_replication.load_system_paasta_config', autospec=True),
         mock.patch("paasta_tools.check_marathon_services_replication._log", autospec=True),
-        mock.patch("paasta_tools.marathon_tools.load_marathon_service_config", autospec=True),
     ) as (
         send_event_patch,
         load_system_paasta_config_patch,
         log_patch,
-        load_marathon_service_config_patch,
     ):
-        load_marathon_service_config_patch.return_value.get_monitoring.return_value = fake_monitoring_overrides
+        mock_job_config = mock.Mock()
+        mock_job_config.get_monitoring.return_value = fake_monitoring_overrides
         check_marathon_services_replication.send_event(fake_service_name,
                                                        fake_namespace,
                                                        fake_cluster,
                                                        fake_soa_dir,
                                                        fake_status,
-                                                       fake_output)
+                                                       fake_output,
+                                                       mock_job_config,
+                                                       fake_system_paasta_config,
+                                                       fake_monitoring_config)
         send_event_patch.call_count == 1
         send_event_patch.assert_called_once_with(
-            fake_service_name,
-            expected_check_name,
-            mock.ANY,
-            fake_status,
-            fake_output,
-            fake_soa_dir
+            service=fake_service_name,
+            check_name=expected_check_name,
+            overrides=mock.ANY,
+            status=fake_status,
+            output=fake_output,
+            soa_dir=fake_soa_dir,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         # The overrides dictionary is mutated in the function under test, so
         # we expect the send_event_patch to be called with something that is a
         # superset of what we originally put in (fake_monitoring_overrides)
-        actual_overrides_used = send_event_patch.call_args[0][2]
+        actual_overrides_used = send_event_patch.call_args[1]['overrides']
         assert set({'alert_after': '666m'}.items()).issubset(set(actual_overrides_used.items()))
         assert not set({'alert_after': '2m'}.items()).issubset(set(actual_overrides_used.items()))
 
@@ -126,28 +139,34 @@ def test_check_smartstack_replication_for_instance_ok_when_expecting_zero():
     expected_replication_count = 0
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
 
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
 
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
 
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
+        )
+        mock_get_smartstack_replication_for_attribute.assert_called_once_with(
+            attribute='region',
+            service=service,
+            namespace=instance,
+            blacklist=mock_service_job_config.get_monitoring_blacklist.return_value,
+            system_paasta_config=fake_system_paasta_config,
+            slaves=mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -156,6 +175,9 @@ def test_check_smartstack_replication_for_instance_ok_when_expecting_zero():
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.OK,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
 
 
@@ -167,25 +189,23 @@ def test_check_smartstack_replication_for_instance_crit_when_absent():
     expected_replication_count = 8
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -193,7 +213,11 @@ def test_check_smartstack_replication_for_instance_crit_when_absent():
             cluster=cluster,
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
-            output=mock.ANY)
+            output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
+        )
 
 
 def test_check_smartstack_replication_for_instance_crit_when_zero_replication():
@@ -204,25 +228,23 @@ def test_check_smartstack_replication_for_instance_crit_when_zero_replication():
     expected_replication_count = 8
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -231,6 +253,9 @@ def test_check_smartstack_replication_for_instance_crit_when_zero_replication():
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -246,25 +271,23 @@ def test_check_smartstack_replication_for_instance_crit_when_low_replication():
     expected_replication_count = 8
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -273,6 +296,9 @@ def test_check_smartstack_replication_for_instance_crit_when_low_replication():
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -288,25 +314,23 @@ def test_check_smartstack_replication_for_instance_ok_with_enough_replication():
     expected_replication_count = 8
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -315,44 +339,15 @@ def test_check_smartstack_replication_for_instance_ok_with_enough_replication():
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.OK,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
         assert "test.everything_up has 8 out of 8 expected instances in fake_region (OK: 100%)" in alert_output
 
 
-def test_check_smartstack_replication_for_instance_ignores_things_under_a_different_namespace():
-    service = 'test'
-    instance = 'main'
-    namespace = 'canary'
-    cluster = 'fake_cluster'
-    available = {'fake_region': {'test.canary': 1, 'test.main': 4, 'test.fully_replicated': 8}}
-    expected_replication_count = 8
-    soa_dir = 'test_dir'
-    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
-    crit = 90
-    with contextlib.nested(
-        mock.patch('paasta_tools.check_marathon_services_replication.send_event_if_under_replication', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=namespace),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
-    ) as (
-        mock_send_event_if_under_replication,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
-    ):
-        mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
-        mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
-        check_marathon_services_replication.check_smartstack_replication_for_instance(
-            service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
-        )
-        mock_send_event_if_under_replication.call_count == 0
-
-
 def test_check_smartstack_replication_for_instance_ok_with_enough_replication_multilocation():
     service = 'test'
     instance = 'everything_up'
@@ -361,25 +356,23 @@ def test_check_smartstack_replication_for_instance_ok_with_enough_replication_mu
     expected_replication_count = 2
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -388,6 +381,9 @@ def test_check_smartstack_replication_for_instance_ok_with_enough_replication_mu
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.OK,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -403,25 +399,23 @@ def test_check_smartstack_replication_for_instance_crit_when_low_replication_mul
     expected_replication_count = 2
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -430,6 +424,9 @@ def test_check_smartstack_replication_for_instance_crit_when_low_replication_mul
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -446,25 +443,23 @@ def test_check_smartstack_replication_for_instance_crit_when_zero_replication_mu
     expected_replication_count = 2
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -473,6 +468,9 @@ def test_check_smartstack_replication_for_instance_crit_when_zero_replication_mu
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -489,25 +487,23 @@ def test_check_smartstack_replication_for_instance_crit_when_missing_replication
     expected_replication_count = 2
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         check_marathon_services_replication.check_smartstack_replication_for_instance(
             service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -516,6 +512,9 @@ def test_check_smartstack_replication_for_instance_crit_when_missing_replication
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -531,25 +530,23 @@ def test_check_smartstack_replication_for_instance_crit_when_no_smartstack_info(
     expected_replication_count = 2
     soa_dir = 'test_dir'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     crit = 90
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.read_registration_for_service_instance',
-                   autospec=True, return_value=compose_job_id(service, instance)),
-        mock.patch('paasta_tools.check_marathon_services_replication.load_smartstack_info_for_service', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True)
+        mock.patch('paasta_tools.check_marathon_services_replication.get_smartstack_replication_for_attribute',
+                   autospec=True),
     ) as (
         mock_send_event,
-        mock_read_registration_for_service_instance,
-        mock_load_smartstack_info_for_service,
-        mock_load_marathon_service_config,
+        mock_get_smartstack_replication_for_attribute,
     ):
-        mock_load_smartstack_info_for_service.return_value = available
+        mock_get_smartstack_replication_for_attribute.return_value = available
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_service_job_config.get_registrations.return_value = [compose_job_id(service, instance)]
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
         check_marathon_services_replication.check_smartstack_replication_for_instance(
-            service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config
+            service, instance, cluster, soa_dir, expected_replication_count, fake_system_paasta_config,
+            mock_service_job_config, ServiceNamespaceConfig(), fake_monitoring_config, mock.sentinel.slaves,
         )
         mock_send_event.assert_called_once_with(
             service=service,
@@ -558,6 +555,9 @@ def test_check_smartstack_replication_for_instance_crit_when_no_smartstack_info(
             soa_dir=soa_dir,
             status=pysensu_yelp.Status.CRITICAL,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -569,22 +569,26 @@ def test_check_service_replication_for_normal_smartstack():
     instance = 'test_instance'
     cluster = 'fake_cluster'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
+    fake_service_namespace_config = ServiceNamespaceConfig({'proxy_port': 666})
     with contextlib.nested(
-        mock.patch('paasta_tools.marathon_tools.get_proxy_port_for_instance',
-                   autospec=True, return_value=666),
         mock.patch('paasta_tools.marathon_tools.get_expected_instance_count_for_namespace',
                    autospec=True, return_value=100),
         mock.patch('paasta_tools.check_marathon_services_replication.check_smartstack_replication_for_instance',
                    autospec=True),
     ) as (
-        mock_get_proxy_port_for_instance,
         mock_get_expected_count,
         mock_check_smartstack_replication_for_service
     ):
-        mock_client = mock.Mock()
+        fake_tasks = [mock.Mock()]
+        mock_job_config = mock.Mock()
+        mock_job_config.get_registrations.return_value = ['test_service.test_instance']
         check_marathon_services_replication.check_service_replication(
-            client=mock_client, service=service, instance=instance, cluster=cluster, soa_dir=None,
-            system_paasta_config=fake_system_paasta_config)
+            all_tasks=fake_tasks, slaves=mock.sentinel.slaves,
+            service=service, instance=instance, cluster=cluster, soa_dir=None,
+            system_paasta_config=fake_system_paasta_config, job_config=mock_job_config,
+            service_namespace_config=fake_service_namespace_config, monitoring_config=fake_monitoring_config)
+        mock_get_expected_count.assert_called_once_with(service, instance, cluster=cluster, soa_dir=None)
         mock_check_smartstack_replication_for_service.assert_called_once_with(
             service=service,
             instance=instance,
@@ -592,42 +596,81 @@ def test_check_service_replication_for_normal_smartstack():
             soa_dir=None,
             expected_count=100,
             system_paasta_config=fake_system_paasta_config,
+            job_config=mock_job_config,
+            service_namespace_config=fake_service_namespace_config,
+            monitoring_config=fake_monitoring_config,
+            slaves=mock.sentinel.slaves,
         )
 
 
+def test_check_service_replication_ignores_things_under_a_different_namespace():
+    service = 'test_service'
+    instance = 'canary'
+    cluster = 'fake_cluster'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
+    fake_service_namespace_config = ServiceNamespaceConfig({'proxy_port': 666})
+    with contextlib.nested(
+        mock.patch('paasta_tools.marathon_tools.get_expected_instance_count_for_namespace',
+                   autospec=True, return_value=100),
+        mock.patch('paasta_tools.check_marathon_services_replication.check_smartstack_replication_for_instance',
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.check_healthy_marathon_tasks_for_service_instance',
+                   autospec=True),
+    ) as (
+        mock_get_expected_count,
+        mock_check_smartstack_replication_for_service,
+        mock_check_healthy_marathon_tasks,
+    ):
+        mock_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+        mock_job_config.get_registrations.return_value = ['test_service.main']
+        check_marathon_services_replication.check_service_replication(
+            all_tasks=[], slaves=[], service=service, instance=instance, cluster=cluster, soa_dir=None,
+            system_paasta_config=fake_system_paasta_config, job_config=mock_job_config,
+            service_namespace_config=fake_service_namespace_config, monitoring_config=fake_monitoring_config)
+        assert mock_get_expected_count.call_count == 0
+        assert mock_check_smartstack_replication_for_service.call_count == 0
+        assert mock_check_healthy_marathon_tasks.call_count == 0
+
+
 def test_check_service_replication_for_non_smartstack():
     service = 'test_service'
     instance = 'worker'
     cluster = 'fake_cluster'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
+    fake_service_namespace_config = ServiceNamespaceConfig({})
     with contextlib.nested(
-        mock.patch('paasta_tools.marathon_tools.get_proxy_port_for_instance', autospec=True, return_value=None),
         mock.patch('paasta_tools.marathon_tools.get_expected_instance_count_for_namespace',
                    autospec=True, return_value=100),
         mock.patch('paasta_tools.check_marathon_services_replication.check_healthy_marathon_tasks_for_service_instance',
                    autospec=True),
     ) as (
-        mock_get_proxy_port_for_instance,
         mock_get_expected_count,
         mock_check_healthy_marathon_tasks,
     ):
-        mock_client = mock.Mock()
+        fake_tasks = [mock.Mock()]
+        mock_job_config = mock.Mock()
         check_marathon_services_replication.check_service_replication(
-            client=mock_client, service=service, instance=instance, cluster=cluster, soa_dir=None,
-            system_paasta_config=fake_system_paasta_config)
+            all_tasks=fake_tasks, slaves=mock.sentinel.slaves,
+            service=service, instance=instance, cluster=cluster, soa_dir=None,
+            system_paasta_config=fake_system_paasta_config, job_config=mock_job_config,
+            service_namespace_config=fake_service_namespace_config, monitoring_config=fake_monitoring_config)
 
         mock_check_healthy_marathon_tasks.assert_called_once_with(
-            client=mock_client,
+            all_tasks=fake_tasks,
             service=service,
             instance=instance,
             cluster=cluster,
             soa_dir=None,
             expected_count=100,
+            job_config=mock_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
 
 
 def test_get_healthy_marathon_instances_for_short_app_id_correctly_counts_alive_tasks():
-    fake_client = mock.Mock()
     fakes = []
     for i in range(0, 4):
         fake_task = mock.Mock()
@@ -636,16 +679,14 @@ def test_get_healthy_marathon_instances_for_short_app_id_correctly_counts_alive_
         mock_result.alive = True if i % 2 == 0 else False
         fake_task.health_check_results = [mock_result]
         fakes.append(fake_task)
-    fake_client.list_tasks.return_value = fakes
     actual = check_marathon_services_replication.get_healthy_marathon_instances_for_short_app_id(
-        fake_client,
+        fakes,
         'service.instance',
     )
     assert actual == 2
 
 
 def test_get_healthy_marathon_instances_for_short_app_id_considers_new_tasks_not_healthy_yet():
-    fake_client = mock.Mock()
     fakes = []
     one_minute = timedelta(minutes=1)
     for i in range(0, 4):
@@ -659,16 +700,14 @@ def test_get_healthy_marathon_instances_for_short_app_id_considers_new_tasks_not
         mock_result.alive = True
         fake_task.health_check_results = [mock_result]
         fakes.append(fake_task)
-    fake_client.list_tasks.return_value = fakes
     actual = check_marathon_services_replication.get_healthy_marathon_instances_for_short_app_id(
-        fake_client,
+        fakes,
         'service.instance',
     )
     assert actual == 3
 
 
 def test_get_healthy_marathon_instances_for_short_app_id_considers_none_start_time_unhealthy():
-    fake_client = mock.Mock()
 
     fake_task = mock.Mock()
     fake_task.app_id = '/service.instance.foo.bar'
@@ -678,9 +717,8 @@ def test_get_healthy_marathon_instances_for_short_app_id_considers_none_start_ti
     fake_task.health_check_results = [mock_result]
 
     fakes = [fake_task]
-    fake_client.list_tasks.return_value = fakes
     actual = check_marathon_services_replication.get_healthy_marathon_instances_for_short_app_id(
-        fake_client,
+        fakes,
         'service.instance',
     )
     assert actual == 0
@@ -694,15 +732,21 @@ def test_check_healthy_marathon_tasks_for_service_instance(mock_healthy_instance
     instance = 'instance'
     cluster = 'cluster'
     soa_dir = 'soa_dir'
-    client = mock.Mock()
+    fake_tasks = [mock.Mock()]
+    job_config = mock.Mock()
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     mock_healthy_instances.return_value = 2
     check_marathon_services_replication.check_healthy_marathon_tasks_for_service_instance(
-        client=client,
+        all_tasks=fake_tasks,
         service=service,
         instance=instance,
         cluster=cluster,
         soa_dir=soa_dir,
-        expected_count=10
+        expected_count=10,
+        job_config=job_config,
+        system_paasta_config=fake_system_paasta_config,
+        monitoring_config=fake_monitoring_config,
     )
     mock_send_event_if_under_replication.assert_called_once_with(
         service=service,
@@ -710,7 +754,10 @@ def test_check_healthy_marathon_tasks_for_service_instance(mock_healthy_instance
         cluster=cluster,
         expected_count=10,
         num_available=2,
-        soa_dir=soa_dir
+        soa_dir=soa_dir,
+        job_config=job_config,
+        system_paasta_config=fake_system_paasta_config,
+        monitoring_config=fake_monitoring_config,
     )
 
 
@@ -719,21 +766,24 @@ def test_check_service_replication_for_namespace_with_no_deployments():
     instance = 'worker'
     cluster = 'fake_cluster'
     fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
+    fake_service_namespace_config = ServiceNamespaceConfig({})
 
     with contextlib.nested(
-        mock.patch('paasta_tools.marathon_tools.get_proxy_port_for_instance', autospec=True, return_value=None),
         mock.patch('paasta_tools.marathon_tools.get_expected_instance_count_for_namespace',
                    autospec=True),
     ) as (
-        mock_get_proxy_port_for_instance,
         mock_get_expected_count,
     ):
-        mock_client = mock.Mock()
+        fake_tasks = [mock.Mock()]
+        mock_job_config = mock.Mock()
         mock_get_expected_count.side_effect = check_marathon_services_replication.NoDeploymentsAvailable
         check_marathon_services_replication.check_service_replication(
-            client=mock_client, service=service, instance=instance, cluster=cluster, soa_dir=None,
-            system_paasta_config=fake_system_paasta_config)
-        assert mock_get_proxy_port_for_instance.call_count == 0
+            all_tasks=fake_tasks, slaves=mock.sentinel.slaves,
+            service=service, instance=instance, cluster=cluster, soa_dir=None,
+            system_paasta_config=fake_system_paasta_config, job_config=mock_job_config,
+            service_namespace_config=fake_service_namespace_config, monitoring_config=fake_monitoring_config)
+        mock_get_expected_count.assert_called_once_with(service, instance, cluster=cluster, soa_dir=None)
 
 
 def test_send_event_if_under_replication_handles_0_expected():
@@ -744,19 +794,19 @@ def test_send_event_if_under_replication_handles_0_expected():
     expected_count = 0
     available = 0
     soa_dir = '/dne'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True),
     ) as (
         mock_send_event,
-        mock_load_marathon_service_config,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
 
         check_marathon_services_replication.send_event_if_under_replication(
-            service, instance, cluster, expected_count, available, soa_dir)
+            service, instance, cluster, expected_count, available, soa_dir, mock_service_job_config,
+            fake_system_paasta_config, fake_monitoring_config)
         mock_send_event.assert_called_once_with(
             service=service,
             namespace=instance,
@@ -764,6 +814,9 @@ def test_send_event_if_under_replication_handles_0_expected():
             soa_dir=soa_dir,
             status=0,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -778,19 +831,19 @@ def test_send_event_if_under_replication_good():
     expected_count = 100
     available = 100
     soa_dir = '/dne'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True),
     ) as (
         mock_send_event,
-        mock_load_marathon_service_config,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
 
         check_marathon_services_replication.send_event_if_under_replication(
-            service, instance, cluster, expected_count, available, soa_dir)
+            service, instance, cluster, expected_count, available, soa_dir, mock_service_job_config,
+            fake_system_paasta_config, fake_monitoring_config)
         mock_send_event.assert_called_once_with(
             service=service,
             namespace=instance,
@@ -798,6 +851,9 @@ def test_send_event_if_under_replication_good():
             soa_dir=soa_dir,
             status=0,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -812,16 +868,15 @@ def test_send_event_if_under_replication_critical():
     expected_count = 100
     available = 89
     soa_dir = '/dne'
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    fake_monitoring_config = {'runbook': 'y/fake_runbook'}
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.send_event', autospec=True),
-        mock.patch('paasta_tools.marathon_tools.load_marathon_service_config', autospec=True),
     ) as (
         mock_send_event,
-        mock_load_marathon_service_config,
     ):
         mock_service_job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
         mock_service_job_config.get_replication_crit_percentage.return_value = crit
-        mock_load_marathon_service_config.return_value = mock_service_job_config
 
         check_marathon_services_replication.send_event_if_under_replication(
             service=service,
@@ -829,7 +884,11 @@ def test_send_event_if_under_replication_critical():
             cluster=cluster,
             expected_count=expected_count,
             num_available=available,
-            soa_dir=soa_dir)
+            soa_dir=soa_dir,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
+        )
         mock_send_event.assert_called_once_with(
             service=service,
             namespace=instance,
@@ -837,6 +896,9 @@ def test_send_event_if_under_replication_critical():
             soa_dir=soa_dir,
             status=2,
             output=mock.ANY,
+            job_config=mock_service_job_config,
+            system_paasta_config=fake_system_paasta_config,
+            monitoring_config=fake_monitoring_config,
         )
         _, send_event_kwargs = mock_send_event.call_args
         alert_output = send_event_kwargs["output"]
@@ -847,7 +909,7 @@ def test_send_event_if_under_replication_critical():
 def test_main():
     soa_dir = 'anw'
     crit = 1
-    services = [('a', 'main'), ('b', 'main'), ('c', 'main')]
+    services = [('a', 'main'), ('b', 'main'), ('c', 'main'), ('c', 'canary'), ('d', 'main')]
     args = mock.Mock(soa_dir=soa_dir, crit=crit, verbose=False)
     with contextlib.nested(
         mock.patch('paasta_tools.check_marathon_services_replication.parse_args',
@@ -859,18 +921,61 @@ def test_main():
         mock.patch('paasta_tools.check_marathon_services_replication.load_system_paasta_config',
                    autospec=True),
         mock.patch('paasta_tools.check_marathon_services_replication.marathon_tools.load_marathon_config',
-                   autospec=True)
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.marathon_tools.load_marathon_service_config',
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.monitoring_tools.get_monitoring_config',
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.marathon_tools.get_marathon_client',
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.mesos_tools.get_slaves',
+                   autospec=True, return_value=[mock.sentinel.slave]),
+        mock.patch('paasta_tools.check_marathon_services_replication.marathon_tools.load_service_namespace_config',
+                   autospec=True),
+        mock.patch('paasta_tools.check_marathon_services_replication.configure_log', autospec=True),
     ) as (
         mock_parse_args,
         mock_get_services_for_cluster,
         mock_check_service_replication,
         mock_load_system_paasta_config,
         mock_load_marathon_config,
+        mock_load_marathon_service_config,
+        mock_get_monitoring_config,
+        mock_get_marathon_client,
+        mock_get_slaves,
+        mock_load_service_namespace_config,
+        mock_configure_log,
     ):
+        def fake_load_marathon_service_config(service, instance, **kwargs):
+            # c.canary announces itself under c.main; d.main has a malformed registration
+            job_config = mock.MagicMock(spec_set=MarathonServiceConfig)
+            if service == 'd':
+                job_config.get_registrations.return_value = ['not_a_registration']
+            else:
+                job_config.get_registrations.return_value = [compose_job_id(service, 'main')]
+            return job_config
+        mock_load_marathon_service_config.side_effect = fake_load_marathon_service_config
+        mock_load_service_namespace_config.side_effect = \
+            lambda service, namespace, soa_dir: ServiceNamespaceConfig({'name': compose_job_id(service, namespace)})
         mock_config = mock.Mock()
         mock_load_marathon_config.return_value = mock_config
+        mock_get_marathon_client.return_value.list_tasks.return_value = [mock.sentinel.task]
         mock_load_system_paasta_config.return_value.get_cluster = mock.Mock(return_value='fake_cluster')
         check_marathon_services_replication.main()
         mock_parse_args.assert_called_once_with()
         mock_get_services_for_cluster.assert_called_once_with(
             cluster='fake_cluster', instance_type='marathon', soa_dir=soa_dir)
+        assert mock_load_marathon_service_config.call_count == len(services)
+        checked = {(kwargs['service'], kwargs['instance'])
+                   for _, kwargs in mock_check_service_replication.call_args_list}
+        assert checked == set(services) - {('d', 'main')}
+        mock_get_marathon_client.return_value.list_tasks.assert_called_once_with()
+        for _, kwargs in mock_check_service_replication.call_args_list:
+            assert kwargs['all_tasks'] == [mock.sentinel.task]
+            assert kwargs['slaves'] == [mock.sentinel.slave]
+        mock_get_slaves.assert_called_once_with()
+        mock_configure_log.assert_called_once_with()
+        assert mock_load_service_namespace_config.call_count == 3
+        for _, kwargs in mock_check_service_replication.call_args_list:
+            assert kwargs['service_namespace_config'] == {'name': compose_job_id(kwargs['service'], 'main')}
+        assert mock_get_monitoring_config.call_count == len({service for service, _ in services})
@@ -237,6 +237,54 @@ class TestMonitoring_Tools:
             service_configuration_lib_patch.assert_called_once_with(self.service, soa_dir=self.soa_dir)
             read_monitoring_patch.assert_called_once_with(self.service, soa_dir=self.soa_dir)
 
+    def test_get_monitoring_config(self):
+        with contextlib.nested(
+            mock.patch('service_configuration_lib.read_service_configuration', autospec=True,
+                       return_value={'team': 'general_test_team', 'monitoring': {'tip': 'general_monitoring_tip'}}),
+            mock.patch('paasta_tools.monitoring_tools.read_monitoring_config',
+                       autospec=True, return_value={'runbook': 'y/monitor_test_runbook'}),
+        ) as (
+            service_configuration_lib_patch,
+            read_monitoring_patch,
+        ):
+            actual = monitoring_tools.get_monitoring_config(self.service, self.soa_dir)
+            assert set(actual.keys()) == set(monitoring_tools.MONITORING_KEYS)
+            assert actual['team'] == 'general_test_team'
+            assert actual['tip'] == 'general_monitoring_tip'
+            assert actual['runbook'] == 'y/monitor_test_runbook'
+            assert actual['ticket'] is False
+            assert actual['notification_email'] is None
+            service_configuration_lib_patch.assert_called_once_with(self.service, soa_dir=self.soa_dir)
+            read_monitoring_patch.assert_called_once_with(self.service, soa_dir=self.soa_dir)
+
+    def test_send_event_applies_overrides_to_monitoring_config(self):
+        fake_monitoring_config = dict(self.fake_monitor_config, ticket=False, project=None, irc_channels=None)
+        with contextlib.nested(
+            mock.patch(
+                "paasta_tools.monitoring_tools.get_monitoring_config",
+                return_value=fake_monitoring_config,
+                autospec=True,
+            ),
+            mock.patch("pysensu_yelp.send_event", autospec=True),
+            mock.patch('paasta_tools.monitoring_tools.load_system_paasta_config', autospec=True),
+        ) as (
+            get_monitoring_config_patch,
+            pysensu_yelp_send_event_patch,
+            load_system_paasta_config_patch,
+        ):
+            monitoring_tools.send_event(
+                self.service,
+                'fake_check_name',
+                {'team': 'override_team', 'page': False},
+                0,
+                'fake_output',
+                self.soa_dir,
+            )
+            _, send_event_args, send_event_kwargs = pysensu_yelp_send_event_patch.mock_calls[0]
+            assert send_event_args[4] == 'override_team'
+            assert send_event_kwargs['page'] is False
+            assert send_event_kwargs['tip'] == 'monitor_test_tip'
+
     def test_get_team_email_address_uses_override_if_specified(self):
         fake_email = 'fake_email'
         with contextlib.nested(
@@ -323,52 +371,25 @@ class TestMonitoring_Tools:
             'source': 'paasta-fake_cluster',
             'ttl': None,
         }
+        fake_monitoring_config = {
+            'team': fake_team,
+            'tip': fake_tip,
+            'notification_email': fake_notification_email,
+            'irc_channels': fake_irc,
+            'ticket': False,
+            'project': None,
+            'page': True,
+        }
         with contextlib.nested(
             mock.patch(
-                "paasta_tools.monitoring_tools.get_team",
-                return_value=fake_team,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_tip",
-                return_value=fake_tip,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_notification_email",
-                return_value=fake_notification_email,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_irc_channels",
-                return_value=fake_irc,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_ticket",
-                return_value=False,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_project",
-                return_value=None,
-                autospec=True,
-            ),
-            mock.patch(
-                "paasta_tools.monitoring_tools.get_page",
-                return_value=True,
+                "paasta_tools.monitoring_tools.get_monitoring_config",
+                return_value=fake_monitoring_config,
                 autospec=True,
             ),
             mock.patch("pysensu_yelp.send_event", autospec=True),
             mock.patch('paasta_tools.monitoring_tools.load_system_paasta_config', autospec=True),
         ) as (
-            get_team_patch,
-            get_tip_patch,
-            get_notification_email_patch,
-            get_irc_patch,
-            get_ticket_patch,
-            get_project_patch,
-            get_page_patch,
+            get_monitoring_config_patch,
             pysensu_yelp_send_event_patch,
             load_system_paasta_config_patch,
         ):
@@ -385,31 +406,10 @@ class TestMonitoring_Tools:
                 fake_soa_dir
             )
 
-            get_team_patch.assert_called_once_with(
-                fake_monitoring_overrides,
+            get_monitoring_config_patch.assert_called_once_with(
                 fake_service,
                 fake_soa_dir,
             )
-            get_tip_patch.assert_called_once_with(
-                fake_monitoring_overrides,
-                fake_service,
-                fake_soa_dir
-            )
-            get_notification_email_patch.assert_called_once_with(
-                fake_monitoring_overrides,
-                fake_service,
-                fake_soa_dir
-            )
-            get_irc_patch.assert_called_once_with(
-                fake_monitoring_overrides,
-                fake_service,
-                fake_soa_dir
-            )
-            get_page_patch.assert_called_once_with(
-                fake_monitoring_overrides,
-                fake_service,
-                fake_soa_dir
-            )
             pysensu_yelp_send_event_patch.assert_called_once_with(
                 expected_check_name,
                 expected_runbook,
@@ -422,6 +422,65 @@ class TestMonitoring_Tools:
             )
             load_system_paasta_config_patch.return_value.get_cluster.assert_called_once_with()
 
+    def test_send_event_uses_provided_system_paasta_config(self):
+        fake_system_paasta_config = mock.Mock()
+        fake_system_paasta_config.get_cluster.return_value = 'fake_cluster'
+        fake_system_paasta_config.get_sensu_host.return_value = 'fake_sensu_host'
+        fake_system_paasta_config.get_sensu_port.return_value = 12345
+        with contextlib.nested(
+            mock.patch(
+                "paasta_tools.monitoring_tools.get_monitoring_config",
+                return_value=dict(self.fake_monitor_config, ticket=False, project=None, irc_channels=None),
+                autospec=True,
+            ),
+            mock.patch("pysensu_yelp.send_event", autospec=True),
+            mock.patch('paasta_tools.monitoring_tools.load_system_paasta_config', autospec=True),
+        ) as (
+            get_monitoring_config_patch,
+            pysensu_yelp_send_event_patch,
+            load_system_paasta_config_patch,
+        ):
+            monitoring_tools.send_event(
+                self.service,
+                'fake_check_name',
+                {},
+                0,
+                'fake_output',
+                self.soa_dir,
+                system_paasta_config=fake_system_paasta_config,
+            )
+            assert load_system_paasta_config_patch.call_count == 0
+            _, _, send_event_kwargs = pysensu_yelp_send_event_patch.mock_calls[0]
+            assert send_event_kwargs['sensu_host'] == 'fake_sensu_host'
+            assert send_event_kwargs['source'] == 'paasta-fake_cluster'
+
+    def test_send_event_uses_provided_monitoring_config(self):
+        fake_monitoring_config = dict(self.fake_monitor_config, ticket=False, project=None, irc_channels=None)
+        with contextlib.nested(
+            mock.patch("paasta_tools.monitoring_tools.get_monitoring_config", autospec=True),
+            mock.patch("pysensu_yelp.send_event", autospec=True),
+            mock.patch('paasta_tools.monitoring_tools.load_system_paasta_config', autospec=True),
+        ) as (
+            get_monitoring_config_patch,
+            pysensu_yelp_send_event_patch,
+            load_system_paasta_config_patch,
+        ):
+            monitoring_tools.send_event(
+                self.service,
+                'fake_check_name',
+                {'tip': 'override_tip'},
+                0,
+                'fake_output',
+                self.soa_dir,
+                monitoring_config=fake_monitoring_config,
+            )
+            assert get_monitoring_config_patch.call_count == 0
+            _, send_event_args, send_event_kwargs = pysensu_yelp_send_event_patch.mock_calls[0]
+            assert send_event_args[4] == 'monitor_test_team'
+            assert send_event_kwargs['tip'] == 'override_tip'
+            # the caller's dict may be shared across events, so it must not be modified
+            assert fake_monitoring_config['tip'] == 'monitor_test_tip'
+
     def test_send_event_sensu_host_is_None(self):
         fake_service = 'fake_service'
         fake_monitoring_overrides = {}
@@ -433,23 +492,15 @@ class TestMonitoring_Tools:
         fake_sensu_port = 12345
 
         with contextlib.nested(
-            mock.patch("paasta_tools.monitoring_tools.get_team", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_tip", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_notification_email", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_irc_channels", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_ticket", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_project", autospec=True),
-            mock.patch("paasta_tools.monitoring_tools.get_page", autospec=True),
+            mock.patch(
+                "paasta_tools.monitoring_tools.get_monitoring_config",
+                return_value=dict(self.fake_monitor_config, ticket=False, project=None, irc_channels=None),
+                autospec=True,
+            ),
             mock.patch("pysensu_yelp.send_event", autospec=True),
             mock.patch('paasta_tools.monitoring_tools.load_system_paasta_config', autospec=True),
         ) as (
-            get_team_patch,
-            get_tip_patch,
-            get_notification_email_patch,
-            get_irc_patch,
-            get_ticket_patch,
-            get_project_patch,
-            get_page_patch,
+            get_monitoring_config_patch,
             pysensu_yelp_send_event_patch,
             load_system_paasta_config_patch,
         ):
@@ -104,6 +104,84 @@ def test_get_smartstack_replication_for_attribute():
         )
 
 
+def test_get_smartstack_replication_for_attribute_with_prefetched_slaves():
+    fake_slaves = [
+        {
+            'hostname': 'hostone',
+            'attributes': {
+                'fake_attribute': 'foo'
+            }
+        },
+        {
+            'hostname': 'hosttwo',
+            'attributes': {
+                'fake_attribute': 'bar'
+            }
+        }
+    ]
+
+    fake_system_paasta_config = SystemPaastaConfig({}, '/fake/config')
+    with contextlib.nested(
+        mock.patch('paasta_tools.mesos_tools.get_all_slaves_for_blacklist_whitelist', autospec=True),
+        mock.patch('paasta_tools.smartstack_tools.get_replication_for_services',
+                   return_value={}, autospec=True),
+    ) as (
+        mock_get_all_slaves_for_blacklist_whitelist,
+        mock_get_replication_for_services,
+    ):
+        actual = smartstack_tools.get_smartstack_replication_for_attribute(
+            attribute='fake_attribute',
+            service='fake_service',
+            namespace='fake_main',
+            blacklist=[['fake_attribute', 'bar']],
+            system_paasta_config=fake_system_paasta_config,
+            slaves=fake_slaves,
+        )
+        assert mock_get_all_slaves_for_blacklist_whitelist.call_count == 0
+        assert actual == {'foo': {}}
+        mock_get_replication_for_services.assert_called_once_with(
+            synapse_host='hostone',
+            synapse_port=fake_system_paasta_config.get_synapse_port(),
+            synapse_haproxy_url_format=fake_system_paasta_config.get_synapse_haproxy_url_format(),
+            services=['fake_service.fake_main'],
+        )
+
+
+def test_get_synapse_query_executor_is_shared():
+    with mock.patch('paasta_tools.smartstack_tools._synapse_query_executor', None, autospec=None):
+        executor = smartstack_tools.get_synapse_query_executor()
+        assert smartstack_tools.get_synapse_query_executor() is executor
+        assert executor._max_workers == smartstack_tools.MAX_SYNAPSE_QUERY_WORKERS
+
+
+def test_get_haproxy_adapter_is_shared():
+    with mock.patch('paasta_tools.smartstack_tools._haproxy_adapter', None, autospec=None):
+        adapter = smartstack_tools.get_haproxy_adapter()
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+        assert smartstack_tools.get_haproxy_adapter() is adapter
+        assert adapter._pool_connections == smartstack_tools.MAX_SYNAPSE_HOST_POOLS
+        assert adapter._pool_maxsize == smartstack_tools.MAX_SYNAPSE_QUERY_WORKERS
+        assert adapter.max_retries.total == 3
+
+
+def test_retrieve_haproxy_csv_mounts_shared_adapter():
+    mock_response = mock.Mock(text='# pxname,svname,\nservice1,host1,\n')
+    with contextlib.nested(
+        mock.patch.object(requests.Session, 'get', autospec=True, return_value=mock_response),
+        mock.patch.object(requests.Session, 'mount', autospec=True),
+        mock.patch('paasta_tools.smartstack_tools.get_haproxy_adapter', autospec=True),
+    ) as (
+        mock_get,
+        mock_mount,
+        mock_get_haproxy_adapter,
+    ):
+        reader = smartstack_tools.retrieve_haproxy_csv('fake_host', 6666, DEFAULT_SYNAPSE_HAPROXY_URL_FORMAT)
+        assert [row['svname'] for row in reader] == ['host1']
+        mock_mount.assert_any_call(mock.ANY, 'http://', mock_get_haproxy_adapter.return_value)
+        mock_mount.assert_any_call(mock.ANY, 'https://', mock_get_haproxy_adapter.return_value)
+        assert mock_get.call_args[1] == {'timeout': 1}
+
+
 def test_get_replication_for_service():
     testdir = os.path.dirname(os.path.realpath(__file__))
     testdata = os.path.join(testdir, 'haproxy_snapshot.txt')
@@ -1272,6 +1272,16 @@ def test_is_under_replicated_critical():
     assert actual == (True, float(0))
 
 
+def test_is_under_replicated_exactly_at_threshold():
+    under_replicated, ratio = utils.is_under_replicated(29, 100, 29)
+    assert under_replicated is False
+    assert abs(ratio - 29) < 1e-9
+    under_replicated, _ = utils.is_under_replicated(1, 3, 34)
+    assert under_replicated is True
+    under_replicated, _ = utils.is_under_replicated(1, 3, 33)
+    assert under_replicated is False
+
+
 def test_deploy_blacklist_to_constraints():
     fake_deploy_blacklist = [["region", "useast1-prod"], ["habitat", "fake_habitat"]]
     expected_constraints = [["region", "UNLIKE", "useast1-prod"], ["habitat", "UNLIKE", "fake_habitat"]]